@@ -8,76 +8,125 @@ The intent of these codes is to identify specific error cases defined by CALDP.
 Any errors not explicitly handled by CALDP are intended to be mapped to
 generic values of 0 or 1 to prevent conflicts with these codes.
 """
-import re
-
-
-_MEMORY_ERROR_NAMES = ["SUBPROCESS_MEMORY_ERROR", "CALDP_MEMORY_ERROR", "CONTAINER_MEMORY_ERROR", "OS_MEMORY_ERROR"]
-
-
-_EXIT_CODES = dict(
-    SUCCESS=0,
-    GENERIC_ERROR=1,
-    CMDLINE_ERROR=2,
-    INPUT_TAR_FILE_ERROR=21,
-    ASTROQUERY_ERROR=22,
-    STAGE1_ERROR=23,
-    STAGE2_ERROR=24,
-    S3_UPLOAD_ERROR=25,
-    S3_DOWNLOAD_ERROR=26,
-    BESTREFS_ERROR=27,
-    CREATE_PREVIEWS_ERROR=28,
-    SUBPROCESS_MEMORY_ERROR=31,  # See caldp-process for this
-    CALDP_MEMORY_ERROR=32,
-    CONTAINER_MEMORY_ERROR=33,
-    OS_MEMORY_ERROR=34,
-    SVM_ERROR=40,
-    MVM_ERROR=41,
-)
-
-
-_NAME_EXPLANATIONS = dict(
-    SUCCESS="Processing completed successfully.",
-    GENERIC_ERROR="An error with no specific CALDP handling occurred somewhere.",
-    CMDLINE_ERROR="The program command line invocation was incorrect.",
-    INPUT_TAR_FILE_ERROR="An error occurred locating or untarring the inputs tarball.",
-    ASTROQUERY_ERROR="An error occurred downloading astroqery: inputs",
-    STAGE1_ERROR="An error occurred in this instrument's stage1 processing step. e.g. calxxx",
-    STAGE2_ERROR="An error occurred in this instrument's stage2 processing step, e.g astrodrizzle",
-    SVM_ERROR="An error occurred while running runsinglehap",
-    MVM_ERROR="An error occurred while running runmultihap",
-    S3_UPLOAD_ERROR="An error occurred uploading the outputs tarball to S3.",
-    S3_DOWNLOAD_ERROR="An error occurred downloading inputs from S3.",
-    BESTREFS_ERROR="An error occurred computing or downloading CRDS reference files.",
-    CREATE_PREVIEWS_ERROR="An error occurrred creating preview files for processed data.",
+from functools import lru_cache
+from types import MappingProxyType
+
+_MEMORY_ERROR_NAMES = ("SUBPROCESS_MEMORY_ERROR", "CALDP_MEMORY_ERROR", "CONTAINER_MEMORY_ERROR", "OS_MEMORY_ERROR")
+
+
+SUCCESS = 0
+GENERIC_ERROR = 1
+CMDLINE_ERROR = 2
+INPUT_TAR_FILE_ERROR = 21
+ASTROQUERY_ERROR = 22
+STAGE1_ERROR = 23
+STAGE2_ERROR = 24
+S3_UPLOAD_ERROR = 25
+S3_DOWNLOAD_ERROR = 26
+BESTREFS_ERROR = 27
+CREATE_PREVIEWS_ERROR = 28
+SUBPROCESS_MEMORY_ERROR = 31  # See caldp-process for this
+CALDP_MEMORY_ERROR = 32
+CONTAINER_MEMORY_ERROR = 33
+OS_MEMORY_ERROR = 34
+SVM_ERROR = 40
+MVM_ERROR = 41
+
+
+_EXIT_CODES = {
+    "SUCCESS": SUCCESS,
+    "GENERIC_ERROR": GENERIC_ERROR,
+    "CMDLINE_ERROR": CMDLINE_ERROR,
+    "INPUT_TAR_FILE_ERROR": INPUT_TAR_FILE_ERROR,
+    "ASTROQUERY_ERROR": ASTROQUERY_ERROR,
+    "STAGE1_ERROR": STAGE1_ERROR,
+    "STAGE2_ERROR": STAGE2_ERROR,
+    "S3_UPLOAD_ERROR": S3_UPLOAD_ERROR,
+    "S3_DOWNLOAD_ERROR": S3_DOWNLOAD_ERROR,
+    "BESTREFS_ERROR": BESTREFS_ERROR,
+    "CREATE_PREVIEWS_ERROR": CREATE_PREVIEWS_ERROR,
+    "SUBPROCESS_MEMORY_ERROR": SUBPROCESS_MEMORY_ERROR,
+    "CALDP_MEMORY_ERROR": CALDP_MEMORY_ERROR,
+    "CONTAINER_MEMORY_ERROR": CONTAINER_MEMORY_ERROR,
+    "OS_MEMORY_ERROR": OS_MEMORY_ERROR,
+    "SVM_ERROR": SVM_ERROR,
+    "MVM_ERROR": MVM_ERROR,
+}
+
+
+_NAME_EXPLANATIONS = {
+    "SUCCESS": "Processing completed successfully.",
+    "GENERIC_ERROR": "An error with no specific CALDP handling occurred somewhere.",
+    "CMDLINE_ERROR": "The program command line invocation was incorrect.",
+    "INPUT_TAR_FILE_ERROR": "An error occurred locating or untarring the inputs tarball.",
+    "ASTROQUERY_ERROR": "An error occurred downloading astroqery: inputs",
+    "STAGE1_ERROR": "An error occurred in this instrument's stage1 processing step. e.g. calxxx",
+    "STAGE2_ERROR": "An error occurred in this instrument's stage2 processing step, e.g astrodrizzle",
+    "SVM_ERROR": "An error occurred while running runsinglehap",
+    "MVM_ERROR": "An error occurred while running runmultihap",
+    "S3_UPLOAD_ERROR": "An error occurred uploading the outputs tarball to S3.",
+    "S3_DOWNLOAD_ERROR": "An error occurred downloading inputs from S3.",
+    "BESTREFS_ERROR": "An error occurred computing or downloading CRDS reference files.",
+    "CREATE_PREVIEWS_ERROR": "An error occurrred creating preview files for processed data.",
     # Potentially see caldp-process bash script for this
-    SUBPROCESS_MEMORY_ERROR="A Python MemoryError was detected by scanning the process.txt log.",
-    CALDP_MEMORY_ERROR="CALDP generated a Python MemoryError during processing or preview creation.",
+    "SUBPROCESS_MEMORY_ERROR": "A Python MemoryError was detected by scanning the process.txt log.",
+    "CALDP_MEMORY_ERROR": "CALDP generated a Python MemoryError during processing or preview creation.",
     # This is never directly returned.  It's intended to be used to trigger a container memory limit
-    CONTAINER_MEMORY_ERROR="The Batch/ECS container runtime killed the job due to memory limits.",
-    OS_MEMORY_ERROR="Python raised OSError(Cannot allocate memory...),  possibly fork failure.",
+    "CONTAINER_MEMORY_ERROR": "The Batch/ECS container runtime killed the job due to memory limits.",
+    "OS_MEMORY_ERROR": "Python raised OSError(Cannot allocate memory...),  possibly fork failure.",
+}
+
+# New exit codes must be added in all three places:  as a named constant above,  to
+# _EXIT_CODES,  and to _NAME_EXPLANATIONS.  These checks catch them getting out of sync.
+assert not (_EXIT_CODES.keys() - _NAME_EXPLANATIONS.keys())
+assert all(globals()[name] == code for name, code in _EXIT_CODES.items())
+assert len(set(_EXIT_CODES.values())) == len(_EXIT_CODES)
+assert not (
+    {name for (name, value) in globals().items() if name.isupper() and isinstance(value, int)} - _EXIT_CODES.keys()
 )
 
-_CODE_TO_NAME = dict()
+# Map names and codes directly to the final explain() string
+_EXPLAIN_TABLE = {}
 
-# Set up original module global variables / named constants
 for (name, code) in _EXIT_CODES.items():
-    globals()[name] = code
-    _CODE_TO_NAME[code] = name
-    _CODE_TO_NAME[str(code)] = name
-    assert name in _NAME_EXPLANATIONS
+    _EXPLAIN_TABLE[name] = _EXPLAIN_TABLE[code] = f"EXIT - {name}[{code}]: {_NAME_EXPLANATIONS[name]}"
+
+# Both the names and the codes of memory errors
+_MEMORY_ERROR_UNION = frozenset(_MEMORY_ERROR_NAMES) | frozenset(_EXIT_CODES[name] for name in _MEMORY_ERROR_NAMES)
+
+_UNHANDLED = "EXIT - unhandled exit code: "
+
+# The lookup tables are constant after init,  expose them read-only
+_EXIT_CODES = MappingProxyType(_EXIT_CODES)
+_NAME_EXPLANATIONS = MappingProxyType(_NAME_EXPLANATIONS)
+_EXPLAIN_TABLE = MappingProxyType(_EXPLAIN_TABLE)
 
 # -----------------------------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=64)
 def explain(exit_code):
     """Return the text explanation for the specified `exit_code`.
 
+    exit_code may be specified as a name string, an integer exit code, or an
+    ASCII decimal string of the integer code.  Leading zeros in a decimal
+    string are normalized away,  e.g. "01" is explained as GENERIC_ERROR.
+
     >>> explain(SUCCESS)
     'EXIT - SUCCESS[0]: Processing completed successfully.'
 
     >>> explain("SUCCESS")
     'EXIT - SUCCESS[0]: Processing completed successfully.'
 
+    >>> explain("0")
+    'EXIT - SUCCESS[0]: Processing completed successfully.'
+
+    >>> explain("01")
+    'EXIT - GENERIC_ERROR[1]: An error with no specific CALDP handling occurred somewhere.'
+
+    >>> explain("\u0661")
+    'EXIT - unhandled exit code: \u0661'
+
     >>> explain(GENERIC_ERROR)
     'EXIT - GENERIC_ERROR[1]: An error with no specific CALDP handling occurred somewhere.'
 
@@ -87,16 +136,12 @@ def explain(exit_code):
     >>> explain(999)
     'EXIT - unhandled exit code: 999'
     """
-    if exit_code in _CODE_TO_NAME:
-        name = _CODE_TO_NAME[exit_code]
-        explanation = _NAME_EXPLANATIONS[name]
-    elif exit_code in _NAME_EXPLANATIONS:
-        name = exit_code
-        exit_code = globals()[name]
-        explanation = _NAME_EXPLANATIONS[name]
-    else:
-        return f"EXIT - unhandled exit code: {exit_code}"
-    return f"EXIT - {name}[{exit_code}]: {explanation}"
+    if isinstance(exit_code, str) and exit_code.isascii() and exit_code.isdecimal():
+        exit_code = int(exit_code)
+    explanation = _EXPLAIN_TABLE.get(exit_code)
+    if explanation is not None:
+        return explanation
+    return _UNHANDLED + str(exit_code)
 
 
 def is_memory_error(exit_code):
@@ -122,7 +167,7 @@ def is_memory_error(exit_code):
     >>> is_memory_error("SUBPROCESS_MEMORY_ERROR")
     True
     """
-    return (exit_code in [globals()[name] for name in _MEMORY_ERROR_NAMES]) or (exit_code in _MEMORY_ERROR_NAMES)
+    return exit_code in _MEMORY_ERROR_UNION
 
 
 # -----------------------------------------------------------------------------------------------
@@ -166,14 +211,25 @@ _LINUX_SIGNALS_TEXT = """
 #define SIGSYS          31      /* Bad system call.  */
 """
 
-SIGNUM_EXPLANATION = {}
+# Signal names which share a signum with a canonical name listed before them in
+# _LINUX_SIGNALS_TEXT,  e.g. signum 6 is both SIGABRT and SIGIOT.  Skip these so the
+# canonical name is reported rather than whichever line happens to come last.
+_SIGNAL_ALIASES = frozenset(["SIGIOT"])
 
-for line in _LINUX_SIGNALS_TEXT.strip().splitlines():
-    match = re.match(r"^\S+\s+(\S+)\s+(\S+)\s+(.*)$", line)
-    sigid = match.group(1)
-    signum = int(match.group(2))
-    sigtext = match.group(3)[2:-2].strip()
-    SIGNUM_EXPLANATION[signum] = f"Killed by UNIX signal {sigid}[{signum}]: '{sigtext}'"
+
+def _signum_explanations():
+    """Parse _LINUX_SIGNALS_TEXT into a read-only {signum: explanation} mapping."""
+    fields = (line.split(None, 3) for line in _LINUX_SIGNALS_TEXT.strip().splitlines())
+    return MappingProxyType(
+        {
+            int(signum): f"Killed by UNIX signal {sigid}[{signum}]: '{sigtext.strip()[2:-2].strip()}'"
+            for (_, sigid, signum, sigtext) in fields
+            if sigid not in _SIGNAL_ALIASES
+        }
+    )
+
+
+SIGNUM_EXPLANATION = _signum_explanations()
 
 
 def explain_signal(signum):
@@ -185,6 +241,9 @@ def explain_signal(signum):
     killed by signals so this function cannot explain everything, e.g. Python
     failures such as MemoryError don't result in signals.
 
+    >>> explain_signal(6)
+    "EXIT - Killed by UNIX signal SIGABRT[6]: 'Abort (ANSI).'"
+
     >>> explain_signal(8)
     "EXIT - Killed by UNIX signal SIGFPE[8]: 'Floating-point exception (ANSI).'"
 